@@ -0,0 +1,72 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from wintry.utils.loaders import LoaderError, discover, to_package_format
+
+
+def test_to_package_format_joins_nested_modules():
+    assert to_package_format(Path("app/sub/module.py")) == "app.sub.module"
+
+
+def test_to_package_format_collapses_init_to_package():
+    assert to_package_format(Path("app/sub/__init__.py")) == "app.sub"
+
+
+def test_to_package_format_keeps_py_inside_names():
+    assert to_package_format(Path("app/pyfoo/z.py")) == "app.pyfoo.z"
+
+
+def test_discover_imports_nested_and_symlinked_packages(tmp_path, monkeypatch):
+    root = tmp_path / "loaderapp"
+    real = tmp_path / "real"
+    (root / "sub").mkdir(parents=True)
+    real.mkdir()
+    (root / "x.py").mkdir()
+    (root / "__pycache__").mkdir()
+
+    for init in (root, root / "sub", real):
+        (init / "__init__.py").touch()
+    (root / "sub" / "nested.py").touch()
+    (real / "linked_module.py").touch()
+    (root / "linked").symlink_to(real, target_is_directory=True)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        discover(Path("loaderapp"), "main:api")
+
+        assert "loaderapp.sub.nested" in sys.modules
+        assert "loaderapp.linked.linked_module" in sys.modules
+        assert "loaderapp.x" not in sys.modules
+    finally:
+        for name in [m for m in sys.modules if m.startswith("loaderapp")]:
+            del sys.modules[name]
+
+
+def test_discover_raises_when_a_directory_cannot_be_listed(tmp_path, monkeypatch):
+    root = tmp_path / "unlistableapp"
+    (root / "sub").mkdir(parents=True)
+    (root / "__init__.py").touch()
+    (root / "sub" / "__init__.py").touch()
+
+    scandir = os.scandir
+
+    def failing_scandir(path):
+        if Path(path).name == "sub":
+            raise PermissionError(f"Permission denied: '{path}'")
+        return scandir(path)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(os, "scandir", failing_scandir)
+
+    try:
+        with pytest.raises(LoaderError):
+            discover(Path("unlistableapp"), "main:api")
+    finally:
+        for name in [m for m in sys.modules if m.startswith("unlistableapp")]:
+            del sys.modules[name]
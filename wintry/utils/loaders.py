@@ -1,4 +1,5 @@
 import importlib
+import os
 from pathlib import Path
 from typing import List
 
@@ -10,32 +11,35 @@ class LoaderError(Exception):
 
 
 def to_package_format(path: Path) -> str:
-    module_fs_path = ".".join(path.parts)
-    # remove module last .py extension
-    module = module_fs_path.replace(".py", "")
+    # drop the .py suffix and join the remaining parts
+    parts = path.with_suffix("").parts
     # if module is like "path.to.module.__init__", then
     # leave it as "path.to.module"
-    if module.endswith(".__init__"):
-        return module.replace(".__init__", "")
+    if len(parts) > 1 and parts[-1] == "__init__":
+        parts = parts[:-1]
 
-    return module
+    return ".".join(parts)
+
+
+def _raise_walk_error(error: OSError):
+    raise LoaderError(str(error)) from error
 
 
 def discover(path: Path, app_path: str):
-    dirs: list[Path] = [path]
-    while dirs:
-        module = dirs.pop(0)
-        for sub_module in module.iterdir():
-            if sub_module.is_dir():
-                dirs.append(sub_module)
-            else:
-                if sub_module.name.endswith(".py"):
-                    try:
-                        mod = to_package_format(sub_module)
-                        if mod not in app_path:
-                            importlib.import_module(mod)
-                    except ModuleNotFoundError as e:
-                        raise LoaderError(str(e))
+    # follow symlinked dirs and prune __pycache__ in place
+    for dirpath, dirnames, filenames in os.walk(
+        path, onerror=_raise_walk_error, followlinks=True
+    ):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        for filename in filenames:
+            if not filename.endswith(".py"):
+                continue
+            try:
+                mod = to_package_format(Path(dirpath, filename))
+                if mod not in app_path:
+                    importlib.import_module(mod)
+            except ModuleNotFoundError as e:
+                raise LoaderError(str(e))
 
 
 def autodiscover_modules(modules: List[str], app_path: str):